@@ -1,24 +1,28 @@
 """The Nightscout integration."""
 
+import asyncio
+
 from aiohttp import ClientError
 from py_nightscout import Api as NightscoutAPI
 
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_API_KEY, CONF_URL, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.entity import SLOW_UPDATE_WARNING
 
 from .const import DOMAIN
-from .coordinator import NightscoutDataUpdateCoordinator
+from .coordinator import (
+    NightscoutConfigEntry,
+    NightscoutData,
+    NightscoutDeviceUpdateCoordinator,
+    NightscoutGlucoseUpdateCoordinator,
+)
 
 PLATFORMS = [Platform.SENSOR]
-_API_TIMEOUT = SLOW_UPDATE_WARNING - 1
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_setup_entry(hass: HomeAssistant, entry: NightscoutConfigEntry) -> bool:
     """Set up Nightscout from a config entry."""
     server_url = entry.data[CONF_URL]
     api_key = entry.data.get(CONF_API_KEY)
@@ -29,10 +33,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     except (ClientError, TimeoutError, OSError) as error:
         raise ConfigEntryNotReady from error
 
-    hass.data.setdefault(DOMAIN, {})
-    coordinator = NightscoutDataUpdateCoordinator(hass, api, entry)
-    await coordinator.async_config_entry_first_refresh()
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    # Glucose readings change every few minutes while pump and treatment data
+    # move much slower, so each is polled by its own coordinator.
+    glucose_coordinator = NightscoutGlucoseUpdateCoordinator(hass, api, entry)
+    device_coordinator = NightscoutDeviceUpdateCoordinator(hass, api, entry)
+    results = await asyncio.gather(
+        glucose_coordinator.async_config_entry_first_refresh(),
+        device_coordinator.async_config_entry_first_refresh(),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    entry.runtime_data = NightscoutData(
+        glucose=glucose_coordinator, device=device_coordinator
+    )
 
     device_registry = dr.async_get(hass)
     device_registry.async_get_or_create(
@@ -45,14 +60,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     return True
 
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Unload a config entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-    if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+async def _async_update_listener(
+    hass: HomeAssistant, entry: NightscoutConfigEntry
+) -> None:
+    """Reload the entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
 
-    return unload_ok
+async def async_unload_entry(hass: HomeAssistant, entry: NightscoutConfigEntry) -> bool:
+    """Unload a config entry."""
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -6,28 +6,53 @@ from typing import Any
 from aiohttp import ClientError, ClientResponseError
 from py_nightscout import Api as NightscoutAPI
 import voluptuous as vol
-
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from yarl import URL
+
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_API_KEY, CONF_URL
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
-
-from .const import DOMAIN
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import (
+    CONF_SHOW_PUMP,
+    CONF_SHOW_SGV,
+    DEFAULT_SHOW_PUMP,
+    DEFAULT_SHOW_SGV,
+    DOMAIN,
+)
 from .utils import hash_from_url
 
 _LOGGER = logging.getLogger(__name__)
 
 DATA_SCHEMA = vol.Schema({vol.Required(CONF_URL): str, vol.Optional(CONF_API_KEY): str})
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_SHOW_SGV, default=DEFAULT_SHOW_SGV): bool,
+        vol.Optional(CONF_SHOW_PUMP, default=DEFAULT_SHOW_PUMP): bool,
+    }
+)
 
 
-async def _validate_input(data: dict[str, Any]) -> dict[str, str]:
+async def _validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, str]:
     """Validate the user input allows us to connect."""
     url: str = data[CONF_URL]
     api_key: str | None = data.get(CONF_API_KEY)
+    session = async_get_clientsession(hass)
     try:
-        api = NightscoutAPI(url, api_secret=api_key)
+        api = NightscoutAPI(url, session=session, api_secret=api_key)
         status = await api.get_server_status()
         if status.settings.get("authDefaultRoles") == "status-only":
-            await api.get_sgvs()
+            sgv_url = (URL(api.server_url) / "api/v1/entries/sgv.json").with_query(
+                {"count": "1"}
+            )
+            async with session.get(sgv_url, **api._api_kwargs) as resp:
+                resp.raise_for_status()
     except ClientResponseError as error:
         raise InputValidationError("invalid_auth") from error
     except (ClientError, TimeoutError, OSError) as error:
@@ -53,7 +78,7 @@ class NightscoutConfigFlow(ConfigFlow, domain=DOMAIN):
             await self.async_set_unique_id(unique_id)
             self._abort_if_unique_id_configured()
             try:
-                info = await _validate_input(user_input)
+                info = await _validate_input(self.hass, user_input)
             except InputValidationError as error:
                 errors["base"] = error.base
             except Exception:
@@ -63,12 +88,40 @@ class NightscoutConfigFlow(ConfigFlow, domain=DOMAIN):
                 return self.async_create_entry(
                     title=info["title"],
                     data={**user_input, "site_name": info["site_name"]},
+                    options={
+                        CONF_SHOW_SGV: DEFAULT_SHOW_SGV,
+                        CONF_SHOW_PUMP: DEFAULT_SHOW_PUMP,
+                    },
                 )
 
         return self.async_show_form(
             step_id="user", data_schema=DATA_SCHEMA, errors=errors
         )
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return NightscoutOptionsFlowHandler()
+
+
+class NightscoutOptionsFlowHandler(OptionsFlow):
+    """Handle the Nightscout options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage which sensors are created."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, self.config_entry.options
+            ),
+        )
+
 
 class InputValidationError(HomeAssistantError):
     """Error to indicate we cannot proceed due to invalid input."""
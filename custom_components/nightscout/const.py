@@ -17,55 +17,60 @@ from homeassistant.const import (
 DOMAIN: Final = "nightscout"
 MANUFACTURER: Final = "Nightscout"
 
+CONF_SHOW_SGV: Final = "show_sgv"
+CONF_SHOW_PUMP: Final = "show_pump"
+
+DEFAULT_SHOW_SGV: Final = True
+DEFAULT_SHOW_PUMP: Final = True
+
 # Define missing constants directly
 CONCENTRATION_MILLIGRAMS_PER_DECILITER = "mg/dL"
 
-SENSOR_TYPES: Final[dict[str, SensorEntityDescription]] = {
-    "sgv": SensorEntityDescription(
+# Sensors derived from the latest SGV entry
+GLUCOSE_SENSOR_TYPES: Final[tuple[SensorEntityDescription, ...]] = (
+    SensorEntityDescription(
         key="sgv",
         name="Blood Sugar",
         native_unit_of_measurement=CONCENTRATION_MILLIGRAMS_PER_DECILITER,
         icon="mdi:diabetes",
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    "sgv_mmol": SensorEntityDescription(
+    SensorEntityDescription(
         key="sgv_mmol",
         name="Blood Sugar mmol/L",
         native_unit_of_measurement="mmol/L",
         icon="mdi:diabetes",
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    "delta": SensorEntityDescription(
+    SensorEntityDescription(
         key="delta",
         name="Blood Sugar Delta",
         native_unit_of_measurement=CONCENTRATION_MILLIGRAMS_PER_DECILITER,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    "delta_mmol": SensorEntityDescription(
+    SensorEntityDescription(
         key="delta_mmol",
         name="Blood Sugar Delta mmol/L",
         native_unit_of_measurement="mmol/L",
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    "direction": SensorEntityDescription(
+    SensorEntityDescription(
         key="direction",
         name="Blood Sugar Direction",
         icon="mdi:diabetes",
     ),
-    "iob": SensorEntityDescription(
-        key="iob",
-        name="Insulin on Board",
-        icon="mdi:insulin",
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    "basal_rate": SensorEntityDescription(
-        key="basal_rate",
-        name="Basal Rate",
-        native_unit_of_measurement="U/hr",
+)
+
+# Sensors derived from the latest pump device status
+PUMP_SENSOR_TYPES: Final[tuple[SensorEntityDescription, ...]] = (
+    SensorEntityDescription(
+        key="reservoir",
+        name="Insulin Remaining",
         icon="mdi:insulin",
+        native_unit_of_measurement="U",
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    "battery": SensorEntityDescription(
+    SensorEntityDescription(
         key="battery",
         name="Pump Battery",
         native_unit_of_measurement=PERCENTAGE,
@@ -73,14 +78,24 @@ SENSOR_TYPES: Final[dict[str, SensorEntityDescription]] = {
         device_class=SensorDeviceClass.BATTERY,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    "reservoir": SensorEntityDescription(
-        key="reservoir",
-        name="Insulin Remaining",
+    SensorEntityDescription(
+        key="iob",
+        name="Insulin on Board",
+        icon="mdi:insulin",
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="basal_rate",
+        name="Basal Rate",
+        native_unit_of_measurement="U/hr",
         icon="mdi:insulin",
-        native_unit_of_measurement="U",
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    "sensor_age": SensorEntityDescription(
+)
+
+# Sensors derived from the most recent site and sensor change treatments
+AGE_SENSOR_TYPES: Final[tuple[SensorEntityDescription, ...]] = (
+    SensorEntityDescription(
         key="sensor_age",
         name="Sensor Age",
         native_unit_of_measurement=UnitOfTime.HOURS,
@@ -88,7 +103,7 @@ SENSOR_TYPES: Final[dict[str, SensorEntityDescription]] = {
         device_class=SensorDeviceClass.DURATION,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-    "cannula_age": SensorEntityDescription(
+    SensorEntityDescription(
         key="cannula_age",
         name="Cannula Age",
         native_unit_of_measurement=UnitOfTime.HOURS,
@@ -96,4 +111,4 @@ SENSOR_TYPES: Final[dict[str, SensorEntityDescription]] = {
         device_class=SensorDeviceClass.DURATION,
         state_class=SensorStateClass.MEASUREMENT,
     ),
-}
\ No newline at end of file
+)
\ No newline at end of file
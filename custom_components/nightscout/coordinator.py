@@ -1,85 +1,170 @@
 """DataUpdateCoordinator for the Nightscout integration."""
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 import logging
 from typing import Any
 
+from aiohttp import ClientError, hdrs
 from py_nightscout import Api as NightscoutAPI
+from yarl import URL
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.entity import SLOW_UPDATE_WARNING
+from homeassistant.helpers.update_coordinator import (
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+from homeassistant.util.json import json_loads
 
-from .const import DOMAIN
+from .const import CONF_SHOW_SGV, DEFAULT_SHOW_SGV, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
+_API_TIMEOUT = SLOW_UPDATE_WARNING - 1
+_MGDL_PER_MMOL = 18.0
+_FETCH_ERRORS = (ClientError, TimeoutError, OSError, ValueError)
+# Returned by _get_latest_entry when a conditional request is answered with 304
+_NOT_MODIFIED: Any = object()
+# Response validators and the request headers that send them back
+_VALIDATOR_HEADERS = (
+    (hdrs.ETAG, hdrs.IF_NONE_MATCH),
+    (hdrs.LAST_MODIFIED, hdrs.IF_MODIFIED_SINCE),
+)
+
+_SENSOR_CHANGE = "Sensor Change"
+_SITE_CHANGE = "Site Change"
+_TREATMENT_EVENT_TYPES = (_SENSOR_CHANGE, _SITE_CHANGE)
+
+
+@dataclass
+class NightscoutData:
+    """Runtime data of a Nightscout config entry."""
+
+    glucose: NightscoutGlucoseUpdateCoordinator
+    device: NightscoutDeviceUpdateCoordinator
+
+
+NightscoutConfigEntry = ConfigEntry[NightscoutData]
 
 
 class NightscoutDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """The Nightscout Data Update Coordinator."""
 
-    config_entry: ConfigEntry
+    config_entry: NightscoutConfigEntry
 
     def __init__(
-        self, hass: HomeAssistant, api: NightscoutAPI, entry: ConfigEntry
+        self,
+        hass: HomeAssistant,
+        api: NightscoutAPI,
+        entry: NightscoutConfigEntry,
+        update_interval: timedelta,
     ) -> None:
         """Initialize the Nightscout coordinator."""
         self.api = api
         self.config_entry = entry
+        self._session = async_get_clientsession(hass)
+        self._validators: dict[URL, dict[str, str]] = {}
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(minutes=1),
+            update_interval=update_interval,
+            always_update=False,
+        )
+
+    async def _get_latest_entry(
+        self, url: URL, conditional: bool = False
+    ) -> dict[str, Any] | None:
+        """Return the first entry of a Nightscout list endpoint.
+
+        A conditional request revalidates the previous answer for the URL and
+        returns _NOT_MODIFIED when the server reports it unchanged.
+        """
+        # py_nightscout does not forward query parameters, so list endpoints
+        # are requested directly to limit them to a single entry.
+        request_kwargs = self.api._api_kwargs
+        validators = self._validators.get(url) if conditional else None
+        if validators:
+            request_kwargs = {
+                **request_kwargs,
+                "headers": {**request_kwargs.get("headers", {}), **validators},
+            }
+
+        async with self._session.get(url, **request_kwargs) as resp:
+            if resp.status == 304 and validators:
+                return _NOT_MODIFIED
+            if resp.status >= 400 and _LOGGER.isEnabledFor(logging.DEBUG):
+                # Only a bounded prefix of the error body is read, and only
+                # when somebody is going to see it.
+                body = await resp.content.read(256)
+                _LOGGER.debug(
+                    "Nightscout returned HTTP %s for %s: %s",
+                    resp.status,
+                    url.path,
+                    body.decode("utf-8", errors="replace"),
+                )
+            resp.raise_for_status()
+            data = await resp.json(loads=json_loads)
+            if conditional:
+                validators = {
+                    request_header: resp.headers[response_header]
+                    for response_header, request_header in _VALIDATOR_HEADERS
+                    if response_header in resp.headers
+                }
+                # Forget validators the server stopped sending, so that later
+                # requests do not revalidate against a stale answer.
+                if validators:
+                    self._validators[url] = validators
+                else:
+                    self._validators.pop(url, None)
+        return data[0] if data else None
+
+
+class NightscoutGlucoseUpdateCoordinator(NightscoutDataUpdateCoordinator):
+    """Coordinator for the glucose readings, polled every minute."""
+
+    def __init__(
+        self, hass: HomeAssistant, api: NightscoutAPI, entry: NightscoutConfigEntry
+    ) -> None:
+        """Initialize the Nightscout glucose coordinator."""
+        super().__init__(hass, api, entry, timedelta(minutes=1))
+        self._sgv_url = (URL(api.server_url) / "api/v1/entries/sgv.json").with_query(
+            {"count": "1"}
         )
 
     async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from Nightscout."""
+        """Fetch glucose data from Nightscout."""
         sgv_mgdl_val = None
         sgv_mmol_val = None
         delta_mgdl = None
         delta_mmol = None
         direction = None
-        device_status = {}
-        sensor_age = None
-        cannula_age = None
 
-        if self.config_entry.data.get("show_sgv", True):
+        if self.config_entry.options.get(CONF_SHOW_SGV, DEFAULT_SHOW_SGV):
             try:
-                sgv_response = await self.api.get_sgvs()
-                if sgv_response:
-                    entry = sgv_response[0]
-                    sgv_mgdl_val = float(entry.sgv)
-                    sgv_mmol_val = float(entry.sgv_mmol)
-                    raw_delta = getattr(entry, "delta", None)
+                async with asyncio.timeout(_API_TIMEOUT):
+                    entry = await self._get_latest_entry(
+                        self._sgv_url, conditional=True
+                    )
+                if entry is _NOT_MODIFIED:
+                    return self.data
+                if entry:
+                    sgv_mgdl_val = float(entry.get("sgv"))
+                    sgv_mmol_val = round(sgv_mgdl_val / _MGDL_PER_MMOL, 1)
+                    raw_delta = entry.get("delta")
                     if raw_delta is not None:
                         delta_mgdl = float(raw_delta)
-                        delta_mmol = round(delta_mgdl / 18.0, 2)
-                    direction = entry.direction
-            except Exception as error:  # pylint: disable=broad-except
-                _LOGGER.error("Error retrieving Nightscout SGV: %s", error)
-
-        try:
-            device_status_response = await self.api.get_devices_status()
-            if device_status_response:
-                latest = device_status_response[0]
-                if hasattr(latest, "pump") and latest.pump:
-                    device_status = latest.pump
-        except Exception as error:  # pylint: disable=broad-except
-            _LOGGER.error("Error retrieving Nightscout device status: %s", error)
-
-        sensor_age = await self._get_treatment_age("Sensor Change")
-        cannula_age = await self._get_treatment_age("Site Change")
-
-        server_status = {}
-        try:
-            server_status_response = await self.api.get_server_status()
-            if server_status_response:
-                server_status = server_status_response
-        except Exception as error:  # pylint: disable=broad-except
-            _LOGGER.error("Error retrieving Nightscout status: %s", error)
+                        delta_mmol = round(delta_mgdl / _MGDL_PER_MMOL, 2)
+                    direction = entry.get("direction")
+            except (*_FETCH_ERRORS, TypeError) as error:
+                raise UpdateFailed(
+                    f"Error retrieving Nightscout SGV: {error}"
+                ) from error
 
         return {
             "sgv": sgv_mgdl_val,
@@ -87,32 +172,116 @@ class NightscoutDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "delta": delta_mgdl,
             "delta_mmol": delta_mmol,
             "direction": direction,
+        }
+
+
+class NightscoutDeviceUpdateCoordinator(NightscoutDataUpdateCoordinator):
+    """Coordinator for pump and treatment data, polled every 5 minutes."""
+
+    def __init__(
+        self, hass: HomeAssistant, api: NightscoutAPI, entry: NightscoutConfigEntry
+    ) -> None:
+        """Initialize the Nightscout device coordinator."""
+        super().__init__(hass, api, entry, timedelta(minutes=5))
+        self._treatments: dict[str, dict[str, Any] | None] = {}
+        self._device_status_url = (
+            URL(api.server_url) / "api/v1/devicestatus.json"
+        ).with_query({"count": "1"})
+        treatments_url = URL(api.server_url) / "api/v1/treatments.json"
+        self._treatment_urls = {
+            event_type: treatments_url.with_query(
+                {"find[eventType]": event_type, "count": "1"}
+            )
+            for event_type in _TREATMENT_EVENT_TYPES
+        }
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch device data from Nightscout."""
+        device_status = {}
+
+        # The endpoints are independent, so fetch each of them once and
+        # concurrently, then derive the sensor values from the results.
+        async with asyncio.timeout(_API_TIMEOUT):
+            results = await asyncio.gather(
+                self._get_latest_entry(self._device_status_url),
+                self._get_latest_treatment(_SENSOR_CHANGE),
+                self._get_latest_treatment(_SITE_CHANGE),
+                return_exceptions=True,
+            )
+
+        # Only fail the update when Nightscout could not be reached at all
+        if all(isinstance(result, _FETCH_ERRORS) for result in results):
+            raise UpdateFailed(
+                f"Error communicating with Nightscout: {results[0]}"
+            ) from results[0]
+
+        latest_device_status, sensor_change, site_change = results
+        latest_device_status = _result_or_none(latest_device_status, "device status")
+        sensor_change = _result_or_none(sensor_change, f"{_SENSOR_CHANGE} treatment")
+        site_change = _result_or_none(site_change, f"{_SITE_CHANGE} treatment")
+
+        # Keep only the plain values the sensors read, so that unchanged polls
+        # compare equal and do not trigger a state write.
+        pump = latest_device_status.get("pump") if latest_device_status else None
+        if pump:
+            device_status = {
+                "reservoir": pump.get("reservoir"),
+                "battery": _nested_value(pump.get("battery"), "percent"),
+                "iob": _nested_value(pump.get("iob"), "bolusiob"),
+                "basal_rate": _nested_value(
+                    pump.get("extended"), "TempBasalAbsoluteRate"
+                ),
+            }
+
+        now = datetime.now(timezone.utc)
+
+        return {
             "device": device_status,
-            "server": server_status,
-            "sensor_age": sensor_age,
-            "cannula_age": cannula_age,
+            "sensor_age": _treatment_age(sensor_change, now),
+            "cannula_age": _treatment_age(site_change, now),
         }
 
-    async def _get_treatment_age(self, event_type: str) -> float | None:
-        """Return hours elapsed since the most recent treatment of the given event type."""
-        try:
-            session = self.api._session
-            if session is None:
-                return None
-            url = f"{self.api.server_url}/api/v1/treatments.json"
-            params = {"find[eventType]": event_type, "count": "1"}
-            async with session.get(url, params=params, **self.api._api_kwargs) as resp:
-                if resp.status != 200:
-                    return None
-                data = await resp.json()
-                if not data:
-                    return None
-                created_at = data[0].get("created_at")
-                if not created_at:
-                    return None
-                ts = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                age_hours = (datetime.now(timezone.utc) - ts).total_seconds() / 3600
-                return round(age_hours, 1)
-        except Exception as error:  # pylint: disable=broad-except
-            _LOGGER.error("Error calculating %s age: %s", event_type, error)
-            return None
+    async def _get_latest_treatment(self, event_type: str) -> dict[str, Any] | None:
+        """Return the most recent treatment of the given event type."""
+        # Revalidate the previous answer so an unchanged treatment costs a
+        # bodiless 304 instead of a new download.
+        treatment = await self._get_latest_entry(
+            self._treatment_urls[event_type], conditional=True
+        )
+        if treatment is _NOT_MODIFIED:
+            return self._treatments[event_type]
+        self._treatments[event_type] = treatment
+        return treatment
+
+
+def _result_or_none(result: Any, description: str) -> Any | None:
+    """Return a gathered result, logging and dropping an expected fetch error."""
+    if isinstance(result, _FETCH_ERRORS):
+        _LOGGER.error("Error retrieving Nightscout %s: %s", description, result)
+        return None
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
+def _nested_value(value: Any, key: str) -> Any | None:
+    """Return a field of a nested JSON object, or None if it is not an object."""
+    return value.get(key) if isinstance(value, dict) else None
+
+
+def _treatment_age(treatment: dict[str, Any] | None, now: datetime) -> float | None:
+    """Return hours elapsed between a treatment and now."""
+    if not treatment:
+        return None
+    created_at = treatment.get("created_at")
+    if not created_at:
+        return None
+    try:
+        ts = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+    except (AttributeError, TypeError, ValueError) as error:
+        _LOGGER.error("Error calculating %s age: %s", treatment.get("eventType"), error)
+        return None
+    # Nightscout stores UTC, but not every uploader includes the offset
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return round((now - ts).total_seconds() / 3600, 1)